@@ -0,0 +1,213 @@
+from pydantic import BaseModel, Field
+from itertools import product
+from typing import List, Optional
+import numpy as np
+import orjson
+import pandas as pd # Import pandas
+
+# Property data shared by the service. Everything here is built once, on first import.
+
+# --- Data Models ---
+
+class Property(BaseModel):
+    """
+    Represents a property with its details.
+    """
+    id: int = Field(..., description="Unique identifier for the property.")
+    name: str = Field(..., description="Name or title of the property.")
+    area: str = Field(..., description="The geographical area where the property is located (e.g., 'Business Bay').")
+    cost: float = Field(..., gt=0, description="The total cost of the property in currency units (e.g., millions).")
+    expected_roi: float = Field(..., ge=0, description="The expected Return on Investment for the property (as a percentage, e.g., 0.05 for 5%).")
+    description: Optional[str] = Field(None, description="A brief description of the property.")
+    address: Optional[str] = Field(None, description="The full address of the property.")
+
+# --- Data Loading (Using Pandas DataFrame) ---
+# Create a dictionary of data that mimics your DUMMY_PROPERTIES
+# In a real scenario, you'd load this from a CSV, Excel, database, etc.
+property_data = {
+    "id": [1, 2, 3, 4, 5, 6, 7, 8],
+    "name": [
+        "Luxury Apartment - Business Bay",
+        "Penthouse Suite - Downtown Dubai",
+        "Modern Villa - Arabian Ranches",
+        "Studio Flat - Business Bay",
+        "Commercial Office - JLT",
+        "Premium Apartment - Business Bay",
+        "Luxury Condo - Palm Jumeirah",
+        "Townhouse - Business Bay",
+    ],
+    "area": [
+        "Business Bay",
+        "Downtown Dubai",
+        "Arabian Ranches",
+        "Business Bay",
+        "JLT",
+        "Business Bay",
+        "Palm Jumeirah",
+        "Business Bay",
+    ],
+    "cost": [
+        1_500_000.00,
+        5_000_000.00,
+        3_000_000.00,
+        800_000.00,
+        2_000_000.00,
+        1_200_000.00,
+        7_000_000.00,
+        2_800_000.00,
+    ],
+    "expected_roi": [0.07, 0.04, 0.06, 0.08, 0.075, 0.065, 0.05, 0.055],
+    "description": [
+        "Spacious 2-bedroom apartment with canal views.",
+        "Exclusive penthouse with panoramic city views.",
+        "Family villa with private garden and pool access.",
+        "Compact studio ideal for young professionals.",
+        "Grade A office space near metro station.",
+        "1-bedroom apartment with high rental yield potential.",
+        "Waterfront condo with private beach access.",
+        "Spacious townhouse in a prime Business Bay location.",
+    ],
+    "address": [
+        "Tower A, Business Bay",
+        "Burj Views, Downtown Dubai",
+        "Al Reem 1, Arabian Ranches",
+        "The Executive Towers, Business Bay",
+        "Cluster D, Jumeirah Lakes Towers",
+        "Bay Square, Business Bay",
+        "Shoreline Apartments, Palm Jumeirah",
+        "Marasi Drive, Business Bay",
+    ],
+}
+
+# Create the DataFrame
+df_properties = pd.DataFrame(property_data)
+
+# Convert DataFrame rows to a list of Property Pydantic models
+# This is done once when the application starts. The rows come from our own data,
+# so validation is skipped with `model_construct`.
+ALL_PROPERTIES: List[Property] = [
+    Property.model_construct(**row) for row in df_properties.to_dict(orient="records")
+]
+
+# Each property serialized to JSON once; responses are built by joining these
+PROPERTY_JSON: List[bytes] = [orjson.dumps(prop.model_dump()) for prop in ALL_PROPERTIES]
+
+# The response for a search without criteria (all properties), serialized once
+CACHED_ALL_JSON: bytes = b"[" + b",".join(PROPERTY_JSON) + b"]"
+
+# Column arrays used for filtering (struct-of-arrays), aligned with ALL_PROPERTIES.
+# Taken from df_properties like every other per-row structure, pinned to float64.
+COSTS = df_properties["cost"].to_numpy(dtype=np.float64)
+ROIS = df_properties["expected_roi"].to_numpy(dtype=np.float64)
+
+# Sorted copies of the range-filtered columns and the row positions in that order,
+# so `cost <= x` and `roi >= y` become binary searches
+COST_ORDER = np.argsort(COSTS, kind="stable")
+COSTS_SORTED = COSTS[COST_ORDER]
+ROI_ORDER = np.argsort(ROIS, kind="stable")
+ROIS_SORTED = ROIS[ROI_ORDER]
+
+# Lowercased area as a categorical column: each row stores a small integer code
+df_properties["area_lc"] = df_properties["area"].str.lower().astype("category")
+AREA_CODES = df_properties["area_lc"].cat.codes.to_numpy()
+
+# Hash index from lowercased area name to the row positions in that area,
+# built with one integer code comparison per category
+AREA_CODE_BY_NAME = {area_lc: code for code, area_lc in enumerate(df_properties["area_lc"].cat.categories)}
+AREA_INDEX = {area_lc: np.flatnonzero(AREA_CODES == code) for area_lc, code in AREA_CODE_BY_NAME.items()}
+EMPTY_ROWS = np.empty(0, dtype=np.int64)
+
+# Every known lowercased area, so unknown areas can be answered without a search
+VALID_AREAS_LC = frozenset(AREA_CODE_BY_NAME)
+
+# Below this many rows a plain Python scan is cheaper than the numpy call overhead
+SCAN_MAX_ROWS = 1_000
+
+# Plain (position, expected_roi, area_lc, cost) tuples for the pure-Python scan
+ROWS: List[tuple] = list(zip(
+    range(len(ALL_PROPERTIES)),
+    ROIS.tolist(),
+    df_properties["area_lc"].tolist(),
+    COSTS.tolist(),
+))
+
+
+def _compile_scan(has_roi: bool, has_area: bool, has_cost: bool):
+    """
+    Generates a scan over the ROWS tuples that only evaluates the given criteria,
+    so the comprehension has no per-row `is None` checks.
+    """
+    conditions = []
+    if has_roi:
+        conditions.append("r >= roi")
+    if has_area:
+        conditions.append("a == area_lc")
+    if has_cost:
+        conditions.append("c <= cost")
+    where = f" if {' and '.join(conditions)}" if conditions else ""
+    source = (
+        "def scan(roi, area_lc, cost):\n"
+        f"    return [i for i, r, a, c in ROWS{where}]\n"
+    )
+    namespace = {"ROWS": ROWS}
+    exec(compile(source, f"<scan roi={has_roi} area={has_area} cost={has_cost}>", "exec"), namespace)
+    return namespace["scan"]
+
+
+# One specialized scan per combination of provided criteria, keyed by
+# (roi provided, area provided, cost provided)
+SCAN_FILTERS = {key: _compile_scan(*key) for key in product((False, True), repeat=3)}
+
+
+def _select_rows_scan(roi: Optional[float], area_lc: Optional[str], cost: Optional[float]) -> List[int]:
+    """
+    Small-data path: the specialized scan over the ROWS tuples for the given criteria.
+    """
+    scan = SCAN_FILTERS[(roi is not None, area_lc is not None, cost is not None)]
+    return scan(roi, area_lc, cost)
+
+
+def _select_rows_indexed(roi: Optional[float], area_lc: Optional[str], cost: Optional[float]) -> np.ndarray:
+    """
+    Large-data path: the area hash index and binary searches on the sorted columns
+    give the candidate rows of each criterion; only the smallest candidate set is
+    then checked against the criteria, in one pass per column.
+    """
+    selections = []
+
+    # Rows in the requested area (one hash lookup)
+    if area_lc is not None:
+        selections.append(AREA_INDEX.get(area_lc, EMPTY_ROWS))
+
+    # Rows with expected_roi >= roi form the tail of ROI_ORDER
+    if roi is not None:
+        k = np.searchsorted(ROIS_SORTED, roi, side="left")
+        selections.append(ROI_ORDER[k:])
+
+    # Rows with cost <= cost form the head of COST_ORDER
+    if cost is not None:
+        k = np.searchsorted(COSTS_SORTED, cost, side="right")
+        selections.append(COST_ORDER[:k])
+
+    if not selections:
+        return np.arange(len(ALL_PROPERTIES))
+
+    rows = np.sort(min(selections, key=len))
+    if roi is not None:
+        rows = rows[ROIS[rows] >= roi]
+    if area_lc is not None:
+        rows = rows[AREA_CODES[rows] == AREA_CODE_BY_NAME.get(area_lc, -1)]
+    if cost is not None:
+        rows = rows[COSTS[rows] <= cost]
+    return rows
+
+
+def select_rows(roi: Optional[float], area_lc: Optional[str], cost: Optional[float]):
+    """
+    Returns the positions (in original row order) of the properties matching
+    every provided criterion. A criterion set to None is ignored;
+    `area_lc` is the requested area already lowercased.
+    """
+    if len(ROWS) <= SCAN_MAX_ROWS:
+        return _select_rows_scan(roi, area_lc, cost)
+    return _select_rows_indexed(roi, area_lc, cost)
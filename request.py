@@ -1,13 +1,23 @@
 import requests
 import json
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
 
 # The base URL of your FastAPI service
 BASE_URL = "http://127.0.0.1:8000"
 
-def search_properties_with_requests(roi: Optional[float] = None, area: Optional[str] = None, cost: Optional[float] = None):
+# Seconds to wait for the service before giving up on a request
+REQUEST_TIMEOUT = 5
+
+# Default session for direct (single-threaded) calls, so sequential calls reuse the
+# keep-alive connection to the service
+SESSION = requests.Session()
+
+def search_properties_with_requests(roi: Optional[float] = None, area: Optional[str] = None, cost: Optional[float] = None, log: Callable[[str], None] = print, session: Optional[requests.Session] = None):
     """
     Calls the FastAPI /properties/search endpoint using the requests library.
+    Uses `session` if given, otherwise the module-level SESSION.
+    Progress and results are written through `log` (printed by default).
     """
     endpoint = f"{BASE_URL}/properties/search"
     params = {}
@@ -19,39 +29,51 @@ def search_properties_with_requests(roi: Optional[float] = None, area: Optional[
     if cost is not None:
         params["cost"] = cost
 
-    print(f"Making GET request to: {endpoint} with params: {params}")
+    log(f"Making GET request to: {endpoint} with params: {params}")
     try:
-        response = requests.get(endpoint, params=params)
+        response = (session or SESSION).get(endpoint, params=params, timeout=REQUEST_TIMEOUT)
         response.raise_for_status() # Raises an HTTPError for bad responses (4xx or 5xx)
 
         properties = response.json()
-        print("Successfully retrieved properties:")
-        print(json.dumps(properties, indent=2, ensure_ascii=False)) # Pretty print JSON
+        log("Successfully retrieved properties:")
+        log(json.dumps(properties, indent=2, ensure_ascii=False)) # Pretty print JSON
         return properties
 
     except requests.exceptions.HTTPError as e:
-        print(f"HTTP Error: {e.response.status_code} - {e.response.text}")
+        log(f"HTTP Error: {e.response.status_code} - {e.response.text}")
     except requests.exceptions.ConnectionError as e:
-        print(f"Connection Error: Could not connect to the FastAPI service. Is it running? {e}")
+        log(f"Connection Error: Could not connect to the FastAPI service. Is it running? {e}")
     except requests.exceptions.Timeout as e:
-        print(f"Timeout Error: The request timed out. {e}")
+        log(f"Timeout Error: The request timed out. {e}")
     except requests.exceptions.RequestException as e:
-        print(f"An error occurred: {e}")
+        log(f"An error occurred: {e}")
     return None
 
 # --- Example Calls ---
+# The examples are independent, so they are sent concurrently: wall time is about the
+# slowest call instead of the sum. requests does not document Session as thread-safe,
+# so each example uses (and closes) its own session rather than the shared SESSION.
+# Each one collects its output and the outputs are printed in order afterwards.
 
-print("\n--- Example 1: Search with ROI, Area, and Cost ---")
-search_properties_with_requests(roi=0.065, area="Business Bay", cost=1500000.0)
-
-print("\n--- Example 2: Search with only ROI and Cost (Area ignored) ---")
-search_properties_with_requests(roi=0.07, cost=2000000.0)
+EXAMPLES = [
+    ("Example 1: Search with ROI, Area, and Cost", dict(roi=0.065, area="Business Bay", cost=1500000.0)),
+    ("Example 2: Search with only ROI and Cost (Area ignored)", dict(roi=0.07, cost=2000000.0)),
+    ("Example 3: Search with only Area (ROI and Cost ignored)", dict(area="Arabian Ranches")),
+    ("Example 4: Search with no parameters (should return all properties)", dict()),
+    ("Example 5: Search with a non-existent area", dict(area="NonExistentArea")),
+]
 
-print("\n--- Example 3: Search with only Area (ROI and Cost ignored) ---")
-search_properties_with_requests(area="Arabian Ranches")
+def run_example(title: str, kwargs: dict):
+    """
+    Runs one example search and returns its output lines.
+    """
+    lines = [f"\n--- {title} ---"]
+    with requests.Session() as session:
+        search_properties_with_requests(**kwargs, log=lines.append, session=session)
+    return lines
 
-print("\n--- Example 4: Search with no parameters (should return all properties) ---")
-search_properties_with_requests()
+with ThreadPoolExecutor(max_workers=len(EXAMPLES)) as executor:
+    outputs = list(executor.map(lambda example: run_example(*example), EXAMPLES))
 
-print("\n--- Example 5: Search with a non-existent area ---")
-search_properties_with_requests(area="NonExistentArea")
+for lines in outputs:
+    print("\n".join(lines))
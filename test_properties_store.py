@@ -0,0 +1,36 @@
+import unittest
+from itertools import product
+
+import properties_store as store
+
+
+def _criteria_values(sorted_values):
+    """
+    None, every value in the data, and a value below, between and above them.
+    """
+    values = sorted(set(sorted_values.tolist()))
+    between = [(a + b) / 2 for a, b in zip(values, values[1:])]
+    return [None, values[0] / 2, *values, *between, values[-1] * 2]
+
+
+class SelectRowsTest(unittest.TestCase):
+    """
+    The indexed path only runs once the data grows past SCAN_MAX_ROWS, so it is
+    checked here against the scan path on every combination of criteria.
+    """
+
+    def test_indexed_path_matches_scan_path(self):
+        rois = _criteria_values(store.ROIS_SORTED)
+        costs = _criteria_values(store.COSTS_SORTED)
+        areas = [None, *sorted(store.AREA_CODE_BY_NAME), "nonexistentarea"]
+
+        for roi, area_lc, cost in product(rois, areas, costs):
+            with self.subTest(roi=roi, area_lc=area_lc, cost=cost):
+                self.assertEqual(
+                    store._select_rows_indexed(roi, area_lc, cost).tolist(),
+                    store._select_rows_scan(roi, area_lc, cost),
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()